@@ -10,7 +10,7 @@
 # add these directories to sys.path here. If the directory is relative to the
 # documentation root, use os.path.abspath to make it absolute, like shown here.
 #
-# import os
+import os
 # import sys
 # sys.path.insert(0, os.path.abspath('.'))
 
@@ -37,6 +37,9 @@ release = '0.1.5'
 
 # -- General configuration ---------------------------------------------------
 
+# Minimal Sphinx version, older versions fetch the intersphinx inventories one after the other.
+needs_sphinx = '3.0'
+
 # Add any Sphinx extension module names here, as strings. They can be
 # extensions coming with Sphinx (named 'sphinx.ext.*') or your custom
 # ones.
@@ -45,13 +48,25 @@ extensions = [
     'sphinx_rtd_theme',
     'myst_parser',
     'numpydoc',
-    'sphinx.ext.autodoc',
+    'autoapi.extension',
     'sphinx.ext.intersphinx',
     'sphinx.ext.doctest',
     'sphinx.ext.viewcode',
     'nbsphinx',
 ]
 
+# All the extensions above are declared parallel read/write safe, the doc can be built
+# with "sphinx-build -j auto". Notebook rendering is by far the slowest step and can be
+# skipped for quick (CI) builds by setting the EESREP_DOCS_SKIP_NOTEBOOKS variable.
+if os.environ.get('EESREP_DOCS_SKIP_NOTEBOOKS'):
+    extensions.remove('nbsphinx')
+
+# Developer previews can set the EESREP_FAST_DOCS variable to also drop the source pages, the
+# doctests and the numpydoc post-processing, the docstrings are still rendered by napoleon.
+if os.environ.get('EESREP_FAST_DOCS'):
+    extensions = [extension for extension in extensions
+                  if extension not in ['numpydoc', 'sphinx.ext.doctest', 'sphinx.ext.viewcode', 'nbsphinx']]
+
 # Add any paths that contain templates here, relative to this directory.
 templates_path = ['_templates']
 
@@ -60,6 +75,9 @@ templates_path = ['_templates']
 # This pattern also affects html_static_path and html_extra_path.
 exclude_patterns = ['_build', 'Thumbs.db', '.DS_Store']
 
+if 'nbsphinx' not in extensions:
+    exclude_patterns.append('tutorials/*.ipynb')
+
 
 # -- Options for HTML output -------------------------------------------------
 
@@ -82,16 +100,36 @@ html_static_path = ['_static']
 intersphinx_mapping = {
     'python': ('https://docs.python.org/3', None),
 }
-autodoc_default_options = {
-    'members': True,
-    'member-order': 'bysource',
-    'special-members': '__init__',
-    'undoc-members': True,
-    'exclude-members': '__weakref__'
-}
+# The inventories are downloaded concurrently by intersphinx, this timeout (in seconds) keeps
+# a slow host from stalling the whole build.
+intersphinx_timeout = 10
+
+# EESREP barely references numpy in its docstrings, its inventory is only loaded for full builds.
+if os.environ.get('EESREP_FULL_DOCS'):
+    intersphinx_mapping['numpy'] = ('https://numpy.org/doc/stable/', None)
+
+# -- Options for autoapi extension -------------------------------------------
+
+# The API pages are generated by parsing the sources, EESREP and its solver modules are not imported.
+autoapi_dirs = ['../../eesrep']
+autoapi_options = [
+    'members',
+    'undoc-members',
+    'show-inheritance',
+    'show-module-summary',
+]
+autoapi_member_order = 'bysource'
+autoapi_python_class_content = 'both'
+
 numpydoc_class_members_toctree = False
 
-intersphinx_mapping['mpi4py'] = ('https://mpi4py.readthedocs.io/en/stable/', None)
-intersphinx_mapping['numpy'] = ('https://docs.scipy.org/doc/numpy/', None)
+# -- Options for nbsphinx extension ------------------------------------------
 
-autodoc_mock_imports = ['medcoupling']
\ No newline at end of file
+# The tutorials are committed with their outputs, running them would call the solvers at each build.
+# Set the EESREP_DOCS_EXECUTE_NOTEBOOKS variable to execute them anyway.
+if os.environ.get('EESREP_DOCS_EXECUTE_NOTEBOOKS'):
+    nbsphinx_execute = 'always'
+else:
+    nbsphinx_execute = 'never'
+nbsphinx_kernel_name = 'python3'
+nbsphinx_timeout = 60
\ No newline at end of file
@@ -52,7 +52,7 @@ function generate_sphinx(){
     cd ${doc_build_dir}
     local options="--no-makefile --no-batchfile --quiet"
     local options="${options} --extensions=sphinx.ext.napoleon --extensions=sphinx_rtd_theme --extensions=myst_parser --extensions=numpydoc"
-    local options="${options} --ext-autodoc --ext-intersphinx --ext-doctest --ext-viewcode"
+    local options="${options} --extensions=autoapi.extension --ext-intersphinx --ext-doctest --ext-viewcode"
     local options="${options} --templatedir ${project_doc_dir}/templates"
     sphinx-quickstart --project ${project_name} -v ${project_version} --author ${project_author} ${options} .
     if (( $? > 0 )); then
@@ -71,7 +71,7 @@ function generate_sphinx(){
 }
 
 function build_html(){
-    local options="-j $(nproc) -b ${sphinx_builder}"
+    local options="-j auto -b ${sphinx_builder}"
     # cp -r ${project_doc_dir}/md_doc ${doc_build_dir}
     sphinx-build ${options} ${doc_build_dir} ${doc_output_dir}
 }
@@ -104,13 +104,8 @@ sphinx_init=false
 sphinx_builder="html"
 
 custom_conf_options="
-autodoc_default_options = {
-    'members': True,
-    'member-order': 'bysource',
-    'special-members': '__init__',
-    'undoc-members': True,
-    'exclude-members': '__weakref__'
-}
+autoapi_dirs = ['../../eesrep']
+autoapi_member_order = 'bysource'
 numpydoc_class_members_toctree = False
 "
 
@@ -170,7 +165,6 @@ if [[ "${sphinx_clean}" == "true" ]]||[[ "${shpinx_do_all}" == "true" ]]; then
     clean
 fi
 if [[ "${sphinx_init}" == "true" ]]||[[ "${shpinx_do_all}" == "true" ]]; then
-    add_sources Sources eesrep ${project_root_dir}
     add_sources Sources tutorials ${project_root_dir}
     
     generate_sphinx
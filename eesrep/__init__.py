@@ -1,7 +1,29 @@
+# -*- coding: utf-8 -*-
+import importlib
+import sys
+
 __version__ = '0.1.5'
 __copyright__ = '2023, CEA'
 __author__ = 'CEA'
 
-from . import components, eesrep_enum, eesrep_io, main, solver_interface
-# -*- coding: utf-8 -*-
-from .main import Eesrep
+__all__ = ["Eesrep", "components", "eesrep_enum", "eesrep_io", "main", "solver_interface"]
+
+if sys.version_info < (3, 7):
+    #   Module level __getattr__ is not supported, the submodules are imported eagerly
+    from . import components, eesrep_enum, eesrep_io, main, solver_interface
+    from .main import Eesrep
+else:
+    def __getattr__(name:str):
+        """Imports the EESREP submodules and the Eesrep class on first access, so that importing
+        eesrep does not load pandas and the solver interfaces."""
+        if name == "Eesrep":
+            globals()[name] = importlib.import_module(".main", __name__).Eesrep
+            return globals()[name]
+
+        if name in __all__:
+            return importlib.import_module("." + name, __name__)
+
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    def __dir__():
+        return sorted(set(globals()) | set(__all__))
@@ -13,6 +13,9 @@ class GenericBus(GenericComponent):
 
     Build_model function is not defined as it is bypassed by EESREP core. 
     """
+
+    __slots__ = ("input", "output", "inputs", "outputs", "_io")
+
     def __init__(self, name:str):
         """Generic bus class with input and output IO.
 
@@ -31,6 +34,11 @@ class GenericBus(GenericComponent):
         self.inputs:List[Tuple[ComponentIO, float, float]] = []
         self.outputs:List[Tuple[ComponentIO, float, float]] = []
 
+        self._io:Dict[str, ComponentIO] = {
+                    "input": self.input,
+                    "output": self.output
+                }
+
     def io_from_parameters(self) -> Dict[str, ComponentIO]:
         """Lists the component Input/Outputs.
 
@@ -40,7 +48,4 @@ class GenericBus(GenericComponent):
             Dictionnary listing the Input/Outputs and their respective ComponentIO objects
 
         """
-        return {
-                    "input": self.input,
-                    "output": self.output
-                }
+        return self._io
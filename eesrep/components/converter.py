@@ -20,6 +20,8 @@ class Converter(GenericComponent):
         The converter output equals input * efficiency
     """
 
+    __slots__ = ("efficiency", "p_min", "p_max", "power_in", "power_out", "_io")
+
     def __init__(self, name:str, efficiency:float, p_min:float, p_max:float):
         """Instanciates a converter with its options, to provide to EESREP
 
@@ -45,6 +47,11 @@ class Converter(GenericComponent):
         self.power_in = ComponentIO(self.name, "power_in", TimeSerieType.INTENSIVE, False)
         self.power_out = ComponentIO(self.name, "power_out", TimeSerieType.INTENSIVE, False)
 
+        self._io = {
+                    "power_in": self.power_in,
+                    "power_out": self.power_out
+                }
+
     def io_from_parameters(self) -> Dict[str, ComponentIO]:
         """Lists the component Input/Outputs.
 
@@ -54,10 +61,7 @@ class Converter(GenericComponent):
             Dictionnary listing the Input/Outputs and their respective ComponentIO objects
 
         """
-        return {
-                    "power_in": self.power_in,
-                    "power_out": self.power_out
-                }
+        return self._io
 
     def build_model(self,
         component_name:str,
@@ -90,8 +94,13 @@ class Converter(GenericComponent):
         variables["power_in"] = model_interface.get_new_continuous_variable_list(component_name+"_power_in_", len(time_steps), None, None)
         variables["power_out"] = model_interface.get_new_continuous_variable_list(component_name+"_power_out_", len(time_steps), self.p_min, self.p_max)
 
+        #   Coefficients are negated once instead of negating every term
+        neg_efficiency = -self.efficiency
+        power_in = variables["power_in"]
+        power_out = variables["power_out"]
+
         for i in range(len(time_steps)):
-            model_interface.add_equality(model_interface.sum_variables([variables["power_out"][i], -variables["power_in"][i]*self.efficiency]), 0)
+            model_interface.add_equality(model_interface.sum_variables([power_out[i], power_in[i]*neg_efficiency]), 0)
 
         return variables, objective
 
@@ -111,6 +120,9 @@ class Cluster(GenericComponent):
             -   turn_on_price is added to the objective at each machine turn-on.
     """
 
+    __slots__ = ("efficiency", "p_min", "p_max", "n_machine_max", "duration_on", "duration_off", "turn_on_price",
+                 "power_in", "power_out", "n_machine", "turn_on", "turn_off", "turn_on_count", "turn_off_count", "_io")
+
     def __init__(self, name:str,
                         efficiency:float,
                         p_min:float,
@@ -160,6 +172,16 @@ class Cluster(GenericComponent):
         self.turn_on_count = ComponentIO(self.name, "turn_on_count", TimeSerieType.INTENSIVE, True)
         self.turn_off_count = ComponentIO(self.name, "turn_off_count", TimeSerieType.INTENSIVE, True)
 
+        self._io = {
+                    "power_in": self.power_in,
+                    "power_out": self.power_out,
+                    "n_machine": self.n_machine,
+                    "turn_on": self.turn_on,
+                    "turn_off": self.turn_off,
+                    "turn_on_count": self.turn_on_count,
+                    "turn_off_count": self.turn_off_count
+                }
+
     def io_from_parameters(self) -> Dict[str, ComponentIO]:
         """Lists the component Input/Outputs.
 
@@ -169,15 +191,7 @@ class Cluster(GenericComponent):
             Dictionnary listing the Input/Outputs and their respective ComponentIO objects
 
         """
-        return {
-                    "power_in": self.power_in,
-                    "power_out": self.power_out,
-                    "n_machine": self.n_machine,
-                    "turn_on": self.turn_on,
-                    "turn_off": self.turn_off,
-                    "turn_on_count": self.turn_on_count,
-                    "turn_off_count": self.turn_off_count
-                }
+        return self._io
 
     def build_model(self,
         component_name:str,
@@ -215,63 +229,146 @@ class Cluster(GenericComponent):
 
         variables["turn_on"] = model_interface.get_new_continuous_variable_list(component_name+"_turn_on_", len(time_steps), 0., None)
         variables["turn_off"] = model_interface.get_new_continuous_variable_list(component_name+"_turn_off_", len(time_steps), 0., None)
-        variables["turn_on_count"] = model_interface.get_new_continuous_variable_list(component_name+"_turn_on_count_", len(time_steps), None, None)
-        variables["turn_off_count"] = model_interface.get_new_continuous_variable_list(component_name+"_turn_off_count_", len(time_steps), None, None)
+
+        #   Counting windows, with a one time step duration or less nothing is counted and the counts are constant zeros
+        window_on = self.duration_on-1
+        window_off = self.duration_off-1
+
+        if window_on > 0:
+            variables["turn_on_count"] = model_interface.get_new_continuous_variable_list(component_name+"_turn_on_count_", len(time_steps), None, None)
+        else:
+            variables["turn_on_count"] = [0.]*len(time_steps)
+
+        if window_off > 0:
+            variables["turn_off_count"] = model_interface.get_new_continuous_variable_list(component_name+"_turn_off_count_", len(time_steps), None, None)
+        else:
+            variables["turn_off_count"] = [0.]*len(time_steps)
 
         variables["n_machine"] = model_interface.get_new_discrete_variable_list(component_name+"_n_machine_", len(time_steps), 0., self.n_machine_max)
 
-        for i in range(len(time_steps)):
+        #   Loop invariants
+        time_step_count = len(time_steps)
+        history_length = len(history)
+        neg_efficiency = -self.efficiency
+        neg_p_max = -self.p_max
+        neg_p_min = -self.p_min
+        neg_n_machine_max = -self.n_machine_max
+
+        #   History columns are read once, positional pandas indexing is slow in the loop
+        if history_length > 0:
+            history_turn_on = history["turn_on"].to_numpy()
+            history_turn_off = history["turn_off"].to_numpy()
+            last_n_machine = float(history["n_machine"].iat[-1])
+            last_turn_on_count = float(history["turn_on_count"].iat[-1])
+            last_turn_off_count = float(history["turn_off_count"].iat[-1])
+        else:
+            history_turn_on = []
+            history_turn_off = []
+
+        power_in = variables["power_in"]
+        power_out = variables["power_out"]
+        turn_on = variables["turn_on"]
+        turn_off = variables["turn_off"]
+        turn_on_count = variables["turn_on_count"]
+        turn_off_count = variables["turn_off_count"]
+        n_machine = variables["n_machine"]
+
+        sum_variables = model_interface.sum_variables
+
+        #   Constraints are gathered as left terms compared to 0, and given to the interface at once
+        equalities = []
+        lower_than = []
+        greater_than = []
+
+        #   Counts Turn_on and Turn_off
+        self._add_window_count(turn_on_count, turn_on, history_turn_on, window_on, model_interface)
+        self._add_window_count(turn_off_count, turn_off, history_turn_off, window_off, model_interface)
+
+        for i in range(time_step_count):
             #   Power_out = f(Power_in)
-            model_interface.add_equality(model_interface.sum_variables([variables["power_out"][i], -variables["power_in"][i]*self.efficiency]), 0)
+            equalities.append(sum_variables([power_out[i], power_in[i]*neg_efficiency]))
             
             #   Constraints Power_out
-            model_interface.add_lower_than(model_interface.sum_variables([variables["power_out"][i], -variables["n_machine"][i]*self.p_max]), 0)
-            model_interface.add_greater_than(model_interface.sum_variables([variables["power_out"][i], -variables["n_machine"][i]*self.p_min]), 0)
+            lower_than.append(sum_variables([power_out[i], n_machine[i]*neg_p_max]))
+            greater_than.append(sum_variables([power_out[i], n_machine[i]*neg_p_min]))
+
+        #   Constraints machine number, the first time step is linked to the previous horizon if any
+        if history_length == 0:
+            #   Counts n_machine changes
+            equalities.append(sum_variables([n_machine[0], turn_off[0], -turn_on[0]]))
+
+        else:
+            #   Counts n_machine changes
+            equalities.append(sum_variables([n_machine[0], -last_n_machine, turn_off[0], -turn_on[0]]))
 
-            #   Counts Turn_on and Turn_off
-            arr_turn_on = []
-            for j in range(self.duration_on-1):
-                if i-j >= 0:
-                    arr_turn_on.append(variables["turn_on"][i-j])
-                elif len(history) > 0 and len(history)+i-j >= 0:
-                    arr_turn_on.append(history["turn_on"].iloc[len(history)+i-j])
+            #   Limits turn off
+            lower_than.append(sum_variables([turn_off[0], -last_n_machine, last_turn_on_count]))
 
-            variables["turn_on_count"][i] = model_interface.sum_variables(arr_turn_on)
+            #   Limits turn on
+            lower_than.append(sum_variables([turn_on[0], neg_n_machine_max, last_n_machine, last_turn_off_count]))
 
-            arr_turn_off = []
-            for j in range(self.duration_off-1):
-                if i-j >= 0:
-                    arr_turn_off.append(variables["turn_off"][i-j])
-                elif len(history) > 0 and len(history)+i-j >= 0:
-                    arr_turn_off.append(history["turn_off"].iloc[len(history)+i-j])
+        for i in range(1, time_step_count):
+            #   Counts n_machine changes
+            equalities.append(sum_variables([n_machine[i], -n_machine[i-1], turn_off[i], -turn_on[i]]))
+            
+            #   Limits turn off
+            lower_than.append(sum_variables([turn_off[i], -n_machine[i-1], turn_on_count[i-1]]))
+
+            #   Limits turn on
+            lower_than.append(sum_variables([turn_on[i], neg_n_machine_max, n_machine[i-1], turn_off_count[i-1]]))
 
-            variables["turn_off_count"][i] = model_interface.sum_variables(arr_turn_off)
+        model_interface.add_equality_list(equalities, [0]*len(equalities))
+        model_interface.add_lower_than_list(lower_than, [0]*len(lower_than))
+        model_interface.add_greater_than_list(greater_than, [0]*len(greater_than))
 
-            #   Constraints machine number
-            if i == 0 and len(history) == 0:
-                #   Counts n_machine changes
-                model_interface.add_equality(model_interface.sum_variables([variables["n_machine"][i], variables["turn_off"][i], -variables["turn_on"][i]]), 0)
+        turn_on_price = self.turn_on_price
+        objective = sum_variables([turn_on_i * turn_on_price for turn_on_i in turn_on])
 
-            elif i == 0 and len(history) > 0:
-                #   Counts n_machine changes
-                model_interface.add_equality(model_interface.sum_variables([variables["n_machine"][i], -history["n_machine"].iloc[-1], variables["turn_off"][i], -variables["turn_on"][i]]), 0)
+        return variables, objective
 
-                #   Limits turn off
-                model_interface.add_lower_than(model_interface.sum_variables([variables["turn_off"][i], -history["n_machine"].iloc[-1], history["turn_on_count"].iloc[-1]]), 0)
+    def _add_window_count(self,
+        count:list,
+        variable:list,
+        history_values:list,
+        window:int,
+        model_interface:GenericInterface):
+        """Constrains count[i] to the sum of variable over the window last time steps, history included.
 
-                #   Limits turn on
-                model_interface.add_lower_than(model_interface.sum_variables([variables["turn_on"][i], -self.n_machine_max, history["n_machine"].iloc[-1], history["turn_off_count"].iloc[-1]]), 0)
+        Nothing is constrained for an empty or negative window, count is then expected to hold constant zeros.
 
+        The sum is written incrementally, count[i] = count[i-1] + variable[i] - variable[i-window], so
+        that every constraint has at most four terms whatever the window length.
+
+        Parameters
+        ----------
+        count : list
+            Count variables, one per time step
+        variable : list
+            Counted variables, one per time step
+        history_values : list
+            Values of the counted variable at the previous horizons
+        window : int
+            Number of time steps counted
+        model_interface : GenericInterface
+            Solver interface used to provide the variables
+        """
+        history_length = len(history_values)
+
+        if window <= 0:
+            return
+
+        sums = [model_interface.sum_variables([count[0],
+                                               -variable[0],
+                                               -sum(history_values[max(history_length-window+1, 0):])])]
+
+        for i in range(1, len(count)):
+            if i-window >= 0:
+                leaving = variable[i-window]
+            elif history_length+i-window >= 0:
+                leaving = history_values[history_length+i-window]
             else:
-                #   Counts n_machine changes
-                model_interface.add_equality(model_interface.sum_variables([variables["n_machine"][i], -variables["n_machine"][i-1], variables["turn_off"][i], -variables["turn_on"][i]]), 0)
-                
-                #   Limits turn off
-                model_interface.add_lower_than(model_interface.sum_variables([variables["turn_off"][i], -variables["n_machine"][i-1], variables["turn_on_count"][i-1]]), 0)
-            
-                #   Limits turn on
-                model_interface.add_lower_than(model_interface.sum_variables([variables["turn_on"][i], -self.n_machine_max, variables["n_machine"][i-1], variables["turn_off_count"][i-1]]), 0)
+                leaving = 0.
 
-        objective = model_interface.sum_variables([variables["turn_on"][i] * self.turn_on_price for i in range(len(time_steps))])
+            sums.append(model_interface.sum_variables([count[i], -count[i-1], -variable[i], leaving]))
 
-        return variables, objective
+        model_interface.add_equality_list(sums, [0]*len(sums))
\ No newline at end of file
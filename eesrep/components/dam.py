@@ -1,5 +1,6 @@
 """This file contains the EESREP generic dam model."""
 from typing import Dict
+import numpy as np
 import pandas as pd
 
 from eesrep.components.generic_component import GenericComponent
@@ -8,16 +9,15 @@ from eesrep.solver_interface.generic_interface import GenericInterface
 from eesrep.eesrep_enum import TimeSerieType
 
 def check_ts(name: str, ts : pd.DataFrame):
-    if not ts.empty:
-        if not "time" in ts.columns:
-            raise KeyError(f"Column time absent from the {name} parameter.")
-        
-        if not "value" in ts.columns:
-            raise KeyError(f"Column value absent from the {name} parameter.")
-        return True
-    else:
+    if ts is None or len(ts.index) == 0:
         return False
 
+    missing_columns = sorted({"time", "value"} - set(ts.columns))
+    if missing_columns:
+        raise KeyError(f"Column {', '.join(missing_columns)} absent from the {name} parameter.")
+
+    return True
+
 class Dam(GenericComponent):
     """EESREP dam component models a basic dam behavior. All inputs and outputs are given in the same unit.
     
@@ -46,6 +46,11 @@ class Dam(GenericComponent):
         -   difference_from_average_price : adds to the objective :
                 price * abs(storage - variable_storage_average*max_storage)
         """
+
+    __slots__ = ("efficiency", "p_min", "p_max", "max_storage", "init_storage", "pump_max", "pump_efficiency",
+                 "free_output", "power_input", "difference_from_limit_price", "difference_from_average_price",
+                 "power_in", "power_out", "storage", "power_pump", "power_free")
+
     def __init__(self,
                     name:str,
                     efficiency:float,
@@ -59,11 +64,11 @@ class Dam(GenericComponent):
                     power_input:bool,
                     difference_from_limit_price:float,
                     difference_from_average_price:float,
-                    run_of_river : pd.DataFrame = pd.DataFrame(),
-                    water_inflow : pd.DataFrame = pd.DataFrame(),
-                    variable_storage_min : pd.DataFrame = pd.DataFrame(),
-                    variable_storage_average : pd.DataFrame = pd.DataFrame(),
-                    variable_storage_max : pd.DataFrame = pd.DataFrame()):
+                    run_of_river : pd.DataFrame = None,
+                    water_inflow : pd.DataFrame = None,
+                    variable_storage_min : pd.DataFrame = None,
+                    variable_storage_average : pd.DataFrame = None,
+                    variable_storage_max : pd.DataFrame = None):
         """Instanciates a Dam component to provide to EESREP.
 
         Parameters
@@ -93,15 +98,15 @@ class Dam(GenericComponent):
         difference_from_average_price : float
             Price for the difference between the storage and average at the last time step
         run_of_river : pd.DataFrame, optional
-            Time serie defining a variable minimal power, by default pd.DataFrame()
+            Time serie defining a variable minimal power, by default None
         water_inflow : pd.DataFrame, optional
-            Time serie defining the dam inflow power, by default pd.DataFrame()
+            Time serie defining the dam inflow power, by default None
         variable_storage_min : pd.DataFrame, optional
-            Time serie defining a variable minimum storage bound, by default pd.DataFrame()
+            Time serie defining a variable minimum storage bound, by default None
         variable_storage_average : pd.DataFrame, optional
-            Time serie defining a variable average storage bound, by default pd.DataFrame()
+            Time serie defining a variable average storage bound, by default None
         variable_storage_max : pd.DataFrame, optional
-            Time serie defining a variable maximum storage bound, by default pd.DataFrame()
+            Time serie defining a variable maximum storage bound, by default None
             
         Raises
         ------
@@ -127,34 +132,15 @@ class Dam(GenericComponent):
 
         self.time_series = {}
 
-        if check_ts("run_of_river", run_of_river):
-            self.time_series["run_of_river"]={
-                                                "type": TimeSerieType.INTENSIVE,
-                                                "value": run_of_river
-                                            }
-
-        if check_ts("water_inflow", water_inflow):
-            self.time_series["water_inflow"]={
-                                                "type": TimeSerieType.INTENSIVE,
-                                                "value": water_inflow
-                                            }
-                                            
-        if check_ts("variable_storage_min", variable_storage_min):
-            self.time_series["variable_storage_min"]={
-                                                "type": TimeSerieType.INTENSIVE,
-                                                "value": variable_storage_min
-                                            }
-
-        if check_ts("variable_storage_average", variable_storage_average):
-            self.time_series["variable_storage_average"]={
-                                                "type": TimeSerieType.INTENSIVE,
-                                                "value": variable_storage_average
-                                            }
-
-        if check_ts("variable_storage_max", variable_storage_max):
-            self.time_series["variable_storage_max"]={
+        for ts_name, ts in (("run_of_river", run_of_river),
+                            ("water_inflow", water_inflow),
+                            ("variable_storage_min", variable_storage_min),
+                            ("variable_storage_average", variable_storage_average),
+                            ("variable_storage_max", variable_storage_max)):
+            if check_ts(ts_name, ts):
+                self.time_series[ts_name]={
                                                 "type": TimeSerieType.INTENSIVE,
-                                                "value": variable_storage_max
+                                                "value": ts
                                             }
 
         self.power_in = ComponentIO(self.name, "power_in", TimeSerieType.INTENSIVE, False)
@@ -214,117 +200,144 @@ class Dam(GenericComponent):
         objective_list = []
         variables = {}
 
+        #   Model options, they do not change along the horizon
+        time_step_count = len(time_steps)
+        history_length = len(history)
+        use_pump = self.pump_max > 0
+        use_free_output = self.free_output > 0
+        use_limit_max = self.difference_from_limit_price > 0 and "variable_storage_max" in time_series
+        use_limit_min = self.difference_from_limit_price > 0 and "variable_storage_min" in time_series
+        use_average = self.difference_from_average_price > 0 and "variable_storage_average" in time_series
+        use_run_of_river = "run_of_river" in time_series
+
         #   Variable declarations
         if self.power_input:
-            variables["power_in"] = model_interface.get_new_continuous_variable_list(component_name+"_power_in_", len(time_steps), 0., None)
+            variables["power_in"] = model_interface.get_new_continuous_variable_list(component_name+"_power_in_", time_step_count, 0., None)
         else:
-            variables["power_in"] = [0.]*len(time_steps)
+            variables["power_in"] = [0.]*time_step_count
         
-        variables["power_out"] = model_interface.get_new_continuous_variable_list(component_name+"_power_out_", len(time_steps), self.p_min, self.p_max)
+        variables["power_out"] = model_interface.get_new_continuous_variable_list(component_name+"_power_out_", time_step_count, self.p_min, self.p_max)
 
-        variables["storage"] = model_interface.get_new_continuous_variable_list(component_name+"_storage_", len(time_steps), 0., self.max_storage)
+        variables["storage"] = model_interface.get_new_continuous_variable_list(component_name+"_storage_", time_step_count, 0., self.max_storage)
 
         if self.free_output:
-            variables["power_free"] = model_interface.get_new_continuous_variable_list(component_name+"_power_free_", len(time_steps), 0, None)
+            variables["power_free"] = model_interface.get_new_continuous_variable_list(component_name+"_power_free_", time_step_count, 0, None)
 
         if self.pump_max:
-            variables["power_pump"] = model_interface.get_new_continuous_variable_list(component_name+"_power_pump_", len(time_steps), 0., self.pump_max)
+            variables["power_pump"] = model_interface.get_new_continuous_variable_list(component_name+"_power_pump_", time_step_count, 0., self.pump_max)
 
-        if self.difference_from_limit_price > 0 and "variable_storage_max" in time_series:
-            variables["difference_to_top_plus"] = model_interface.get_new_continuous_variable_list(component_name+"_difference_to_top_plus_", len(time_steps), 0., None)
-            variables["difference_to_top_minus"] = model_interface.get_new_continuous_variable_list(component_name+"_difference_to_top_minus_", len(time_steps), 0., None)
+        if use_limit_max:
+            variables["difference_to_top_plus"] = model_interface.get_new_continuous_variable_list(component_name+"_difference_to_top_plus_", time_step_count, 0., None)
+            variables["difference_to_top_minus"] = model_interface.get_new_continuous_variable_list(component_name+"_difference_to_top_minus_", time_step_count, 0., None)
 
-        if self.difference_from_limit_price > 0 and "variable_storage_min" in time_series:
-            variables["difference_to_bottom_plus"] = model_interface.get_new_continuous_variable_list(component_name+"_difference_to_bottom_plus_", len(time_steps), 0., None)
-            variables["difference_to_bottom_minus"] = model_interface.get_new_continuous_variable_list(component_name+"_difference_to_bottom_minus_", len(time_steps), 0., None)
+        if use_limit_min:
+            variables["difference_to_bottom_plus"] = model_interface.get_new_continuous_variable_list(component_name+"_difference_to_bottom_plus_", time_step_count, 0., None)
+            variables["difference_to_bottom_minus"] = model_interface.get_new_continuous_variable_list(component_name+"_difference_to_bottom_minus_", time_step_count, 0., None)
 
-        if self.difference_from_average_price > 0 and "variable_storage_average" in time_series:
+        if use_average:
             variables["final_difference_to_average_plus"] = model_interface.get_new_continuous_variable(component_name+"_final_difference_to_average_plus_0", 0., None)
             variables["final_difference_to_average_minus"] = model_interface.get_new_continuous_variable(component_name+"_final_difference_to_average_minus_0", 0., None)
 
 
         #   Model definition
-        if len(history) > 0:
-            power_init = history["storage"].loc[len(history)-1]
+        if history_length > 0:
+            power_init = float(history["storage"].iat[-1])
         else:
             power_init = self.max_storage * self.init_storage
 
-        for i in range(len(time_steps)):
-            time_step = time_steps[i]
-            #   Storage bounds
-            if "variable_storage_min" in time_series:
-                min_storage = self.max_storage * time_series["variable_storage_min"][i]
-            else:
-                min_storage = 0.
-
-            if "variable_storage_max" in time_series:
-                max_storage = self.max_storage * time_series["variable_storage_max"][i]
-            else:
-                max_storage = self.max_storage
-
-            if self.difference_from_limit_price > 0 and "variable_storage_max" in time_series:
-                
-                model_interface.add_equality(model_interface.sum_variables([variables["storage"][i],
-                                                    -max_storage,
-                                                    -variables["difference_to_top_plus"][i],
-                                                    variables["difference_to_top_minus"][i]]), 0)
+        storage = variables["storage"]
 
-                objective_list.append(self.difference_from_limit_price * variables["difference_to_top_plus"][i])
-            else:
-                model_interface.add_lower_than(variables["storage"][i], max_storage)
+        #   Coefficients are computed for the whole horizon, and the constraints given to the interface at once
+        time_step_arr = np.array(time_steps, dtype=float)
+        power_in_coefs = (-time_step_arr).tolist()
+        power_out_coefs = (time_step_arr/self.efficiency).tolist()
+        time_step_list = time_step_arr.tolist()
 
-            if self.difference_from_limit_price > 0 and "variable_storage_min" in time_series:
-                model_interface.add_equality(model_interface.sum_variables([variables["storage"][i],
-                                                    -min_storage,
-                                                    -variables["difference_to_bottom_plus"][i],
-                                                    variables["difference_to_bottom_minus"][i]]), 0)
+        #   Time series are read once as arrays, pandas indexing is slow in the loop
+        if "water_inflow" in time_series:
+            inflow_volumes = (time_series["water_inflow"].to_numpy()*time_step_arr).tolist()
+        else:
+            inflow_volumes = [0.]*time_step_count
 
-                objective_list.append(self.difference_from_limit_price * variables["difference_to_top_plus"][i])
+        #   Adds pump if max power greater than 0
+        if use_pump:
+            pump_variables = variables["power_pump"]
+            power_pump_coefs = (-self.pump_efficiency*time_step_arr).tolist()
+        else:
+            pump_variables = [0.]*time_step_count
+            power_pump_coefs = [0.]*time_step_count
 
-                objective_list.append(self.difference_from_limit_price * variables["difference_to_bottom_minus"][i])
-            else:
-                model_interface.add_greater_than(variables["storage"][i], min_storage)
+        #   Adds free output if exists
+        if use_free_output:
+            free_variables = variables["power_free"]
+        else:
+            free_variables = [0.]*time_step_count
 
+        #   Storage bounds, the constant ones are already the storage variables bounds
+        if "variable_storage_min" in time_series:
+            min_storage = (self.max_storage * time_series["variable_storage_min"].to_numpy()).tolist()
+        else:
+            min_storage = [0.]*time_step_count
 
-            #   Adds pump if max power greater than 0
-            if self.pump_max > 0:
-                pump_variable = variables["power_pump"][i]*self.pump_efficiency
-            else:
-                pump_variable = 0.
+        if "variable_storage_max" in time_series:
+            max_storage = (self.max_storage * time_series["variable_storage_max"].to_numpy()).tolist()
+        else:
+            max_storage = [self.max_storage]*time_step_count
+
+        equalities = []
 
-            if "water_inflow" in time_series:
-                inflow = time_series["water_inflow"][i]
-            else:
-                inflow = 0.
+        #   Objective terms are added per variable list rather than per time step
+        limit_price = self.difference_from_limit_price
+
+        if use_limit_max:
+            for i in range(time_step_count):
+                equalities.append(model_interface.sum_variables([storage[i],
+                                                    -max_storage[i],
+                                                    -variables["difference_to_top_plus"][i],
+                                                    variables["difference_to_top_minus"][i]]))
+
+            objective_list.extend([limit_price * top_plus for top_plus in variables["difference_to_top_plus"]])
+        elif "variable_storage_max" in time_series:
+            model_interface.add_lower_than_list(storage, max_storage)
+
+        if use_limit_min:
+            for i in range(time_step_count):
+                equalities.append(model_interface.sum_variables([storage[i],
+                                                    -min_storage[i],
+                                                    -variables["difference_to_bottom_plus"][i],
+                                                    variables["difference_to_bottom_minus"][i]]))
 
-            #   Adds free output if exists
-            if self.free_output > 0:
-                free_variable = variables["power_free"][i]
-            else:
-                free_variable = 0.
+            objective_list.extend([limit_price * bottom_minus for bottom_minus in variables["difference_to_bottom_minus"]])
+        elif "variable_storage_min" in time_series:
+            model_interface.add_greater_than_list(storage, min_storage)
 
-            if i == 0:
-                past_storage = power_init
-            else:
-                past_storage = variables["storage"][i-1]
+        model_interface.add_equality_list(equalities, [0]*len(equalities))
 
+        #   Mass conservation, the inflow volume is the right hand side
+        past_storage = [power_init] + storage[:-1]
+        mass_conservation = [model_interface.sum_scaled_variables([variables["power_in"][i],
+                                                                   variables["power_out"][i],
+                                                                   free_variables[i],
+                                                                   pump_variables[i],
+                                                                   storage[i],
+                                                                   past_storage[i]],
+                                                                  [power_in_coefs[i],
+                                                                   power_out_coefs[i],
+                                                                   time_step_list[i],
+                                                                   power_pump_coefs[i],
+                                                                   1.,
+                                                                   -1.]) for i in range(time_step_count)]
 
-            #   Mass conservation
-            model_interface.add_equality(model_interface.sum_variables([-variables["power_in"][i]*time_step,
-                                                variables["power_out"][i]*time_step/self.efficiency,
-                                                free_variable*time_step,
-                                                -pump_variable*time_step,
-                                                -inflow*time_step,
-                                                variables["storage"][i],
-                                                -past_storage]), 0)
+        model_interface.add_equality_list(mass_conservation, inflow_volumes)
 
-            if "run_of_river" in time_series:
-                model_interface.add_greater_than(model_interface.sum_variables([variables["power_out"][i], free_variable]), time_series["run_of_river"].loc[i])
+        if use_run_of_river:
+            model_interface.add_greater_than_list([model_interface.sum_variables([variables["power_out"][i], free_variables[i]]) for i in range(time_step_count)],
+                                                  time_series["run_of_river"].to_numpy().tolist())
 
 
-        if self.difference_from_average_price > 0. and "variable_storage_average" in time_series:
+        if use_average:
             model_interface.add_equality(model_interface.sum_variables([variables["storage"][-1],
-                                                -time_series["variable_storage_average"].loc[len(time_series)-1]*self.max_storage,
+                                                -time_series["variable_storage_average"].to_numpy()[-1]*self.max_storage,
                                                 -variables["final_difference_to_average_plus"],
                                                 variables["final_difference_to_average_minus"]]), 0)
 
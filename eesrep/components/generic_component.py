@@ -11,6 +11,7 @@ from typing import Dict, List
 
 import pandas as pd
 from eesrep.eesrep_io import ComponentIO
+from eesrep.eesrep_enum import TimeSerieType
 
 from eesrep.solver_interface.generic_interface import GenericInterface
 
@@ -18,6 +19,9 @@ from eesrep.solver_interface.generic_interface import GenericInterface
 class GenericComponent:
     """EESREP generic model class"""
 
+    #   Components that do not declare __slots__ keep an instance __dict__
+    __slots__ = ("name", "time_series")
+
     def __init__(self):
         self.name:str = ""
         self.time_series = {}
@@ -41,6 +45,9 @@ class GenericComponent:
     def io_from_parameters(self) -> Dict[str, ComponentIO]:
         """Lists the component Input/Outputs.
 
+        The Input/Outputs do not depend on the horizon, components may build this dictionnary once and
+        return the same object at each call. Callers share it and must not modify it.
+
         Returns
         -------
         dict
@@ -62,6 +69,9 @@ class GenericComponent:
         future:pd.DataFrame = None):
         """Builds the model at the current horizon.
 
+        Components are built independently of each other: build_model must only read its own parameters and
+        the given arguments, and only add variables and constraints through model_interface.
+
         Parameters
         ----------
         component_name : str
@@ -77,6 +87,11 @@ class GenericComponent:
         future : pd.DataFrame
             Dataframe with the previsions of variables of previous iterations if "continuity" is at true.
 
+        Returns
+        -------
+        tuple
+            Dictionnary of the IO values, as lists of MILP variables or arrays of fixed values, and the component objective
+
         Raises
         ------
         NotImplementedError
@@ -88,4 +103,33 @@ class GenericComponent:
         try:
             return self.time_series
         except AttributeError:
-            raise AttributeError("time_series is not an attribute of the custom component.")
\ No newline at end of file
+            raise AttributeError("time_series is not an attribute of the custom component.")
+
+    def _add_time_serie(self, name:str, ts:pd.DataFrame, ts_type:TimeSerieType):
+        """Checks a time serie parameter and adds it to the component time series if it is provided.
+
+        Parameters
+        ----------
+        name : str
+            Name of the time serie parameter
+        ts : pd.DataFrame
+            Time serie parameter, ignored if None or empty
+        ts_type : TimeSerieType
+            Type of the time serie
+
+        Raises
+        ------
+        KeyError
+            The time or value column is absent from the time serie.
+        """
+        if ts is None or len(ts.index) == 0:
+            return
+
+        missing_columns = sorted({"time", "value"} - set(ts.columns))
+        if missing_columns:
+            raise KeyError(f"Column {', '.join(missing_columns)} absent from the {name} parameter.")
+
+        self.time_series[name] = {
+                                    "type": ts_type,
+                                    "value": ts
+                                }
\ No newline at end of file
@@ -28,7 +28,9 @@ class Source(GenericComponent):
     The price variation time serie multiplies the price if provided.
     """
 
-    def __init__(self, name:str, p_min:float, p_max:float, price:float, price_variation:pd.DataFrame = pd.DataFrame()):
+    __slots__ = ("p_min", "p_max", "price", "power_out", "_io")
+
+    def __init__(self, name:str, p_min:float, p_max:float, price:float, price_variation:pd.DataFrame = None):
         """Instanciates a source component with its options, to provide to EESREP.
 
         Parameters
@@ -42,7 +44,7 @@ class Source(GenericComponent):
         price : float
             Price of each energy unit provided by the source
         price_variation : pd.DataFrame, optional
-            Time serie that multiplies the price
+            Time serie that multiplies the price, by default None
         """
 
         self.name = name
@@ -52,20 +54,14 @@ class Source(GenericComponent):
 
         self.time_series = {}
 
-        if not price_variation.empty:
-            if not "time" in price_variation.columns:
-                raise KeyError("Column time absent from the price_variation parameter.")
-            
-            if not "value" in price_variation.columns:
-                raise KeyError("Column value absent from the price_variation parameter.")
-
-            self.time_series["price_variation"]={
-                                                    "type": TimeSerieType.INTENSIVE,
-                                                    "value": price_variation
-                                                }
+        self._add_time_serie("price_variation", price_variation, TimeSerieType.INTENSIVE)
 
         self.power_out = ComponentIO(self.name, "power_out", TimeSerieType.INTENSIVE, False)
 
+        self._io = {
+                    "power_out": self.power_out
+                }
+
     def io_from_parameters(self) -> Dict[str, ComponentIO]:
         """Lists the component Input/Outputs.
 
@@ -75,9 +71,7 @@ class Source(GenericComponent):
             Dictionnary listing the Input/Outputs and their respective ComponentIO objects
 
         """
-        return {
-                    "power_out": self.power_out
-                }
+        return self._io
 
     def build_model(self,
         component_name:str,
@@ -109,12 +103,12 @@ class Source(GenericComponent):
         variables = {}
         variables["power_out"] = model_interface.get_new_continuous_variable_list(component_name+"_power_out_", len(time_steps), self.p_min, self.p_max)
 
+        #   The price of each time step is computed at once, without variation it is a common factor of the sum
         if "price_variation" in time_series:
-            price_variation = time_series["price_variation"]
+            prices = (self.price*time_series["price_variation"].to_numpy()).tolist()
+            objective = model_interface.sum_scaled_variables(variables["power_out"], prices)
         else:
-            price_variation = [1. for _ in range(len(time_steps))]
-
-        objective = model_interface.sum_variables([self.price*variables["power_out"][i]*price_variation[i] for i in range(len(time_steps))])
+            objective = self.price*model_interface.sum_variables(variables["power_out"])
 
         return variables, objective
 
@@ -131,7 +125,9 @@ class Sink(GenericComponent):
     The price variation time serie multiplies the price if provided.
     """
 
-    def __init__(self, name:str, p_min:float, p_max:float, price:float, price_variation:pd.DataFrame = pd.DataFrame()):
+    __slots__ = ("p_min", "p_max", "price", "power_in", "_io")
+
+    def __init__(self, name:str, p_min:float, p_max:float, price:float, price_variation:pd.DataFrame = None):
         """Instanciates a sink component with its options, to provide to EESREP.
 
         Parameters
@@ -145,7 +141,7 @@ class Sink(GenericComponent):
         price : float
             Price of each energy unit taken by the sink
         price_variation : pd.DataFrame, optional
-            Time serie that multiplies the price
+            Time serie that multiplies the price, by default None
         """
 
         self.name = name
@@ -155,20 +151,14 @@ class Sink(GenericComponent):
 
         self.time_series = {}
 
-        if not price_variation.empty:
-            if not "time" in price_variation.columns:
-                raise KeyError("Column time absent from the price_variation parameter.")
-            
-            if not "value" in price_variation.columns:
-                raise KeyError("Column value absent from the price_variation parameter.")
-
-            self.time_series["price_variation"]={
-                                                    "type": TimeSerieType.INTENSIVE,
-                                                    "value": price_variation
-                                                }
+        self._add_time_serie("price_variation", price_variation, TimeSerieType.INTENSIVE)
 
         self.power_in = ComponentIO(self.name, "power_in", TimeSerieType.INTENSIVE, False)
 
+        self._io = {
+                    "power_in": self.power_in
+                }
+
     def io_from_parameters(self) -> Dict[str, ComponentIO]:
         """Lists the component Input/Outputs.
 
@@ -178,9 +168,7 @@ class Sink(GenericComponent):
             Dictionnary listing the Input/Outputs and their respective ComponentIO objects
 
         """
-        return {
-                    "power_in": self.power_in
-                }
+        return self._io
 
     def build_model(self,
         component_name:str,
@@ -212,12 +200,12 @@ class Sink(GenericComponent):
 
         variables["power_in"] = model_interface.get_new_continuous_variable_list(component_name+"_power_in_", len(time_steps), self.p_min, self.p_max)
 
+        #   The price of each time step is computed at once, without variation it is a common factor of the sum
         if "price_variation" in time_series:
-            price_variation = time_series["price_variation"]
+            prices = (self.price*time_series["price_variation"].to_numpy()).tolist()
+            objective = model_interface.sum_scaled_variables(variables["power_in"], prices)
         else:
-            price_variation = [1. for _ in range(len(time_steps))]
-
-        objective = model_interface.sum_variables([self.price*variables["power_in"][i]*price_variation[i] for i in range(len(time_steps))])
+            objective = self.price*model_interface.sum_variables(variables["power_in"])
 
         return variables, objective
 
@@ -229,7 +217,9 @@ class FatalSource(GenericComponent):
     
     The amount provided is given by the source_flow time serie.
     """
-    
+
+    __slots__ = ("power_out", "_io")
+
     def __init__(self, name:str, source_flow:pd.DataFrame):
         """Instanciates a sink component with its options, to provide to EESREP.
 
@@ -245,21 +235,14 @@ class FatalSource(GenericComponent):
 
         self.time_series = {}
 
-        if not source_flow.empty:
-
-            if not "time" in source_flow.columns:
-                raise KeyError("Column time absent from the source_flow parameter.")
-            
-            if not "value" in source_flow.columns:
-                raise KeyError("Column value absent from the source_flow parameter.")
-
-            self.time_series["source_flow"]={
-                                                    "type": TimeSerieType.INTENSIVE,
-                                                    "value": source_flow
-                                                }
+        self._add_time_serie("source_flow", source_flow, TimeSerieType.INTENSIVE)
 
         self.power_out = ComponentIO(self.name, "power_out", TimeSerieType.INTENSIVE, False)
 
+        self._io = {
+                    "power_out": self.power_out
+                }
+
     def io_from_parameters(self) -> Dict[str, ComponentIO]:
         """Lists the component Input/Outputs.
 
@@ -269,9 +252,7 @@ class FatalSource(GenericComponent):
             Dictionnary listing the Input/Outputs and their respective ComponentIO objects
 
         """
-        return {
-                    "power_out": self.power_out
-                }
+        return self._io
 
     def build_model(self,
         component_name:str,
@@ -301,7 +282,7 @@ class FatalSource(GenericComponent):
         objective = 0.
         variables = {}
 
-        variables["power_out"] = time_series["source_flow"]
+        variables["power_out"] = time_series["source_flow"].to_numpy()
 
         return variables, objective
 
@@ -313,6 +294,9 @@ class FatalSink(GenericComponent):
     
     The amount pulled is given by the sink_flow time serie.
     """
+
+    __slots__ = ("power_in", "_io")
+
     def __init__(self, name:str, sink_flow:pd.DataFrame):
         """Instanciates a fatal sink component with its options, to provide to EESREP.
 
@@ -328,20 +312,13 @@ class FatalSink(GenericComponent):
 
         self.time_series = {}
 
-        if not sink_flow.empty:
-
-            if not "time" in sink_flow.columns:
-                raise KeyError("Column time absent from the sink_flow parameter.")
-            
-            if not "value" in sink_flow.columns:
-                raise KeyError("Column value absent from the sink_flow parameter.")
-
-            self.time_series["sink_flow"]={
-                                                "type": TimeSerieType.INTENSIVE,
-                                                "value": sink_flow
-                                            }
+        self._add_time_serie("sink_flow", sink_flow, TimeSerieType.INTENSIVE)
 
         self.power_in = ComponentIO(self.name, "power_in", TimeSerieType.INTENSIVE, False)
+
+        self._io = {
+                    "power_in": self.power_in
+                }
         
 
     def io_from_parameters(self) -> Dict[str, ComponentIO]:
@@ -353,9 +330,7 @@ class FatalSink(GenericComponent):
             Dictionnary listing the Input/Outputs and their respective ComponentIO objects
 
         """
-        return {
-                    "power_in": self.power_in
-                }
+        return self._io
 
     def build_model(self,
         component_name:str,
@@ -385,6 +360,6 @@ class FatalSink(GenericComponent):
         objective = 0.
         variables = {}
 
-        variables["power_in"] = time_series["sink_flow"]
+        variables["power_in"] = time_series["sink_flow"].to_numpy()
 
         return variables, objective
@@ -3,6 +3,7 @@
 import math
 from typing import Dict
 
+import numpy as np
 import pandas as pd
 
 from eesrep.components.generic_component import GenericComponent
@@ -27,6 +28,9 @@ class GenericStorage(GenericComponent):
         - storage : amount stored at each time step.
     
     """
+
+    __slots__ = ("p_max", "storage_max", "efficiency", "init_storage", "flow", "storage", "_io")
+
     def __init__(self, name:str, p_max:float, storage_max:float, efficiency:float, init_storage:float):
         """Instanciates a storage component with its options, to provide to EESREP.
 
@@ -63,6 +67,11 @@ class GenericStorage(GenericComponent):
         self.flow = ComponentIO(self.name, "flow", TimeSerieType.INTENSIVE, False)
         self.storage = ComponentIO(self.name, "storage", TimeSerieType.EXTENSIVE, True)
 
+        self._io = {
+                    "flow": self.flow,
+                    "storage": self.storage
+                }
+
     def io_from_parameters(self) -> Dict[str, ComponentIO]:
         """Lists the component Input/Outputs.
 
@@ -72,10 +81,7 @@ class GenericStorage(GenericComponent):
             Dictionnary listing the Input/Outputs and their respective ComponentIO objects
 
         """
-        return {
-                    "flow": self.flow,
-                    "storage": self.storage
-                }
+        return self._io
 
     def build_model(self,
         component_name:str,
@@ -114,9 +120,13 @@ class GenericStorage(GenericComponent):
         else:
             storage_init = self.init_storage*self.storage_max
 
-        model_interface.add_equality(model_interface.sum_variables([variables["storage"][0], -storage_init, -variables["flow"][0]*math.sqrt(self.efficiency)*time_steps[0]]), 0)
-        
-        for i in range(1, len(time_steps)):
-            model_interface.add_equality(model_interface.sum_variables([variables["storage"][i], -variables["storage"][i-1], -variables["flow"][i]*math.sqrt(self.efficiency)*time_steps[i]]), 0)
-        
+        #   Storage balance, the constraints of all time steps are given to the interface at once
+        flow_coefs = (-math.sqrt(self.efficiency)*np.array(time_steps, dtype=float)).tolist()
+        past_storage = [storage_init] + variables["storage"][:-1]
+        balance = [model_interface.sum_scaled_variables([variables["storage"][i], past_storage[i], variables["flow"][i]],
+                                                        [1., -1., flow_coefs[i]])
+                        for i in range(len(time_steps))]
+
+        model_interface.add_equality_list(balance, [0]*len(balance))
+
         return variables, objective
\ No newline at end of file
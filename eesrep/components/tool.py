@@ -37,6 +37,11 @@ class Delayer(GenericComponent):
         self.power_in = ComponentIO(self.name, "power_in", TimeSerieType.INTENSIVE, True)
         self.power_out = ComponentIO(self.name, "power_out", TimeSerieType.INTENSIVE, False)
 
+        self._io = {
+                    "power_in": self.power_in,
+                    "power_out": self.power_out
+                }
+
     def io_from_parameters(self) -> Dict[str, ComponentIO]:
         """Lists the component Input/Outputs.
 
@@ -46,10 +51,7 @@ class Delayer(GenericComponent):
             Dictionnary listing the Input/Outputs and their respective ComponentIO objects
 
         """
-        return {
-                    "power_in": self.power_in,
-                    "power_out": self.power_out
-                }
+        return self._io
 
     def build_model(self,
         component_name:str,
@@ -83,16 +85,24 @@ class Delayer(GenericComponent):
         variables["power_in"] = model_interface.get_new_continuous_variable_list(component_name+"_power_in_", len(time_steps), None, None)
         variables["power_out"] = model_interface.get_new_continuous_variable_list(component_name+"_power_out_", len(time_steps), None, None)
 
-        for i in range(len(time_steps)):
-            if i-self.delay_time >=0:
-                model_interface.add_equality(model_interface.sum_variables([variables["power_out"][i],
-                                                    -variables["power_in"][i-self.delay_time]]), 0)
-            elif -(i-self.delay_time) <= len(history):
-                model_interface.add_equality(model_interface.sum_variables([variables["power_out"][i],
-                                                    -history["power_in"].iloc[i-self.delay_time]]), 0)
-            else:
-                model_interface.add_equality(model_interface.sum_variables([variables["power_out"][i],
-                                                    -self.default_value]), 0)
+        #   History is read once as a list, pandas indexing is slow in the loop
+        history_values = history["power_in"].to_numpy().tolist() if len(history) > 0 else []
+
+        power_in = variables["power_in"]
+        time_step_count = len(time_steps)
+        history_length = len(history_values)
+        delay = self.delay_time
+
+        #   The delayed input of every time step is resolved at once: default values before the history start,
+        #   then the history values, then the input variables
+        default_count = min(max(delay-history_length, 0), time_step_count)
+        history_end = min(delay, time_step_count)
+
+        delayed = [self.default_value]*default_count \
+                    + history_values[history_length+default_count-delay:history_length+history_end-delay] \
+                    + power_in[:max(time_step_count-delay, 0)]
+
+        model_interface.add_equality_list(variables["power_out"], delayed)
         return variables, objective
 
 
@@ -120,6 +130,11 @@ class Integral(GenericComponent):
         self.power_in = ComponentIO(self.name, "power_in", TimeSerieType.INTENSIVE, True)
         self.power_out = ComponentIO(self.name, "power_out", TimeSerieType.INTENSIVE, False)
 
+        self._io = {
+                    "power_in": self.power_in,
+                    "power_out": self.power_out
+                }
+
     def io_from_parameters(self) -> Dict[str, ComponentIO]:
         """Lists the component Input/Outputs.
 
@@ -129,10 +144,7 @@ class Integral(GenericComponent):
             Dictionnary listing the Input/Outputs and their respective ComponentIO objects
 
         """
-        return {
-                    "power_in": self.power_in,
-                    "power_out": self.power_out
-                }
+        return self._io
 
     def build_model(self,
         component_name:str,
@@ -166,24 +178,44 @@ class Integral(GenericComponent):
         variables["power_in"] = model_interface.get_new_continuous_variable_list(component_name+"_power_in_", len(time_steps), None, None)
         variables["power_out"] = model_interface.get_new_continuous_variable_list(component_name+"_power_out_", len(time_steps), None, None)
 
-        for i in range(len(time_steps)):
-            s = []
+        power_in = variables["power_in"]
+        power_out = variables["power_out"]
+        window = self.integration_time
+
+        if window <= 0:
+            model_interface.add_equality_list(power_out, [0]*len(power_out))
+            return variables, objective
 
-            for j in range(self.integration_time):
-                if i-j >=0:
-                    s.append(variables["power_in"][i-j])
-                elif -(i-j) <= len(history):
-                    s.append(history["power_in"].iloc[i-j])
-            
-            s.append(-variables["power_out"][i])
-            model_interface.add_equality(model_interface.sum_variables(s), 0)
+        history_values = history["power_in"].to_numpy().tolist() if len(history) > 0 else []
+        history_length = len(history_values)
+
+        #   The rolling sum is written incrementally, power_out[i] = power_out[i-1] + power_in[i] - power_in[i-window],
+        #   so that every constraint has at most four terms whatever the integration time
+        sum_variables = model_interface.sum_variables
+        time_step_count = len(time_steps)
+
+        sums = [sum_variables([power_out[0],
+                               -power_in[0],
+                               -sum(history_values[max(history_length-window+1, 0):])])]
+
+        for i in range(1, time_step_count):
+            if i-window >= 0:
+                leaving = power_in[i-window]
+            elif history_length+i-window >= 0:
+                leaving = history_values[history_length+i-window]
+            else:
+                leaving = 0.
+
+            sums.append(sum_variables([power_out[i], -power_out[i-1], -power_in[i], leaving]))
+
+        model_interface.add_equality_list(sums, [0]*len(sums))
 
         return variables, objective
 
 class LowerThan(GenericComponent):
     """Component that adds a lower than constraint on its input to a value or a given time serie.
     """
-    def __init__(self, name:str, value:float, value_serie:pd.DataFrame = pd.DataFrame()):
+    def __init__(self, name:str, value:float, value_serie:pd.DataFrame = None):
         """Instanciates a lower_than component with its options, to provide to EESREP.
 
         Parameters
@@ -193,7 +225,7 @@ class LowerThan(GenericComponent):
         value : float
             Value to be lower than.
         value_serie : pd.DataFrame, optional
-            Time serie than can replace the value parameter
+            Time serie than can replace the value parameter, by default None
 
         """
         self.name = name
@@ -201,20 +233,14 @@ class LowerThan(GenericComponent):
 
         self.time_series = {}
         
-        if not value_serie.empty:
-            if not "time" in value_serie.columns:
-                raise KeyError("Column time absent from the value_serie parameter.")
-            
-            if not "value" in value_serie.columns:
-                raise KeyError("Column value absent from the value_serie parameter.")
-
-            self.time_series["value_serie"]={
-                                                    "type": TimeSerieType.INTENSIVE,
-                                                    "value": value_serie
-                                                }
+        self._add_time_serie("value_serie", value_serie, TimeSerieType.INTENSIVE)
 
         self.power_in = ComponentIO(self.name, "power_in", TimeSerieType.INTENSIVE, True)
 
+        self._io = {
+                    "power_in": self.power_in
+                }
+
     def io_from_parameters(self) -> Dict[str, ComponentIO]:
         """Lists the component Input/Outputs.
 
@@ -224,9 +250,7 @@ class LowerThan(GenericComponent):
             Dictionnary listing the Input/Outputs and their respective ComponentIO objects
 
         """
-        return {
-                    "power_in": self.power_in
-                }
+        return self._io
 
     def build_model(self,
         component_name:str,
@@ -259,18 +283,20 @@ class LowerThan(GenericComponent):
         
         variables["power_in"] = model_interface.get_new_continuous_variable_list(component_name+"_power_in_", len(time_steps), None, None)
 
-        for i in range(len(time_steps)):
-            if "value_serie" in time_series:
-                model_interface.add_lower_than(variables["power_in"][i], time_series.loc[i, "value_serie"])
-            else:
-                model_interface.add_lower_than(variables["power_in"][i], self.value)
+        #   The bounds of all time steps are given to the interface at once
+        if "value_serie" in time_series:
+            values = time_series["value_serie"].to_numpy().tolist()
+        else:
+            values = [self.value]*len(time_steps)
+
+        model_interface.add_lower_than_list(variables["power_in"], values)
 
         return variables, objective
 
 class GreaterThan(GenericComponent):
     """Component that adds a greater than constraint on its input to a value or a given time serie.
     """
-    def __init__(self, name:str, value:float, value_serie:pd.DataFrame = pd.DataFrame()):
+    def __init__(self, name:str, value:float, value_serie:pd.DataFrame = None):
         """Instanciates a greater_than component with its options, to provide to EESREP.
 
         Parameters
@@ -280,7 +306,7 @@ class GreaterThan(GenericComponent):
         value : float
             Value to be greater than.
         value_serie : pd.DataFrame, optional
-            Time serie than can replace the value parameter
+            Time serie than can replace the value parameter, by default None
 
         """
         self.name = name
@@ -288,20 +314,14 @@ class GreaterThan(GenericComponent):
 
         self.time_series = {}
         
-        if not value_serie.empty:
-            if not "time" in value_serie.columns:
-                raise KeyError("Column time absent from the value_serie parameter.")
-            
-            if not "value" in value_serie.columns:
-                raise KeyError("Column value absent from the value_serie parameter.")
-
-            self.time_series["value_serie"]={
-                                                    "type": TimeSerieType.INTENSIVE,
-                                                    "value": value_serie
-                                                }
+        self._add_time_serie("value_serie", value_serie, TimeSerieType.INTENSIVE)
 
         self.power_in = ComponentIO(self.name, "power_in", TimeSerieType.INTENSIVE, True)
 
+        self._io = {
+                    "power_in": self.power_in
+                }
+
     def io_from_parameters(self) -> Dict[str, ComponentIO]:
         """Lists the component Input/Outputs.
 
@@ -311,9 +331,7 @@ class GreaterThan(GenericComponent):
             Dictionnary listing the Input/Outputs and their respective ComponentIO objects
 
         """
-        return {
-                    "power_in": self.power_in
-                }
+        return self._io
 
     def build_model(self,
         component_name:str,
@@ -346,10 +364,12 @@ class GreaterThan(GenericComponent):
         
         variables["power_in"] = model_interface.get_new_continuous_variable_list(component_name+"_power_in_", len(time_steps), None, None)
 
-        for i in range(len(time_steps)):
-            if "value_serie" in time_series:
-                model_interface.add_greater_than(variables["power_in"][i], time_series.loc[i, "value_serie"])
-            else:
-                model_interface.add_greater_than(variables["power_in"][i], self.value)
+        #   The bounds of all time steps are given to the interface at once
+        if "value_serie" in time_series:
+            values = time_series["value_serie"].to_numpy().tolist()
+        else:
+            values = [self.value]*len(time_steps)
+
+        model_interface.add_greater_than_list(variables["power_in"], values)
 
         return variables, objective
@@ -7,6 +7,8 @@ class ComponentIO:
         Component Input/Output definition.
     """
 
+    __slots__ = ("component_name", "io_name", "type", "continuity", "_key")
+
     def __init__(self, component_name:str, io_name:str, io_type:TimeSerieType, io_continuity:bool):
         """_summary_
 
@@ -24,30 +26,35 @@ class ComponentIO:
         Raises
         ------
             TypeError
-                Wrong type given for any parameter.
+                Wrong type given for any parameter, not checked when python runs optimised (-O).
         """        
-        if not isinstance(component_name, str):
-            raise TypeError("component_name parameter should be a string.")
-        if not isinstance(io_name, str):
-            raise TypeError("io_name parameter should be a string.")
-        if not isinstance(io_type, TimeSerieType):
-            raise TypeError("io_type parameter should be a TimeSerieType.")
-        if not isinstance(io_continuity, bool):
-            raise TypeError("io_continuity parameter should be a boolean.")
+        #   The parameter checks are skipped when python runs optimised (-O)
+        if __debug__:
+            if not isinstance(component_name, str):
+                raise TypeError("component_name parameter should be a string.")
+            if not isinstance(io_name, str):
+                raise TypeError("io_name parameter should be a string.")
+            if not isinstance(io_type, TimeSerieType):
+                raise TypeError("io_type parameter should be a TimeSerieType.")
+            if not isinstance(io_continuity, bool):
+                raise TypeError("io_continuity parameter should be a boolean.")
 
         self.component_name:str = component_name
         self.io_name:str = io_name
         self.type:TimeSerieType = io_type
         self.continuity:bool = io_continuity
 
+        #   The IO definition does not change, comparisons and hashes use this tuple
+        self._key = (component_name, io_name, io_type, io_continuity)
+
     def __eq__(self, other):
         if isinstance(other, self.__class__):
-            return self.component_name == other.component_name and \
-                self.io_name == other.io_name and \
-                    self.type == other.type and \
-                        self.continuity == other.continuity
+            return self._key == other._key
         else:
             return False
 
+    def __hash__(self):
+        return hash(self._key)
+
     def __ne__(self, other):
         return not self.__eq__(other)
\ No newline at end of file
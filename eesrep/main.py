@@ -5,6 +5,7 @@ import os
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
 
 from .components.generic_component import GenericComponent
@@ -41,6 +42,9 @@ except ImportError:
 
 from .eesrep_enum import SolverOption, TimeSerieType
 
+#   Names of the solver interfaces shipped with EESREP
+_BUILTIN_INTERFACES = frozenset(("mip", "docplex", "pyomo"))
+
 class Eesrep:
     """
         ESREP model builder and solver class
@@ -68,6 +72,9 @@ class Eesrep:
         self.__model : GenericInterface = None
 
         self.__components: Dict[str, GenericComponent] = {}
+        self.__components_io: Dict[str, Dict[str, ComponentIO]] = {}
+        self.__intensive_io: Dict[str, bool] = {}
+        self.__continuous_io: Dict[str, List[str]] = {}
         self.__variables: Dict[str, Dict[str, Any]] = {}
         self.__buses: Dict[str, GenericBus] = {}
         self.__results: pd.DataFrame = pd.DataFrame()
@@ -104,21 +111,23 @@ class Eesrep:
             ------
                 ValueError: The solver argument provided while creating an Eesrep object is not correct.
         """
-        if self.__interface.lower() not in ["mip", "docplex", "pyomo"] + list(self.__custom_interfaces.keys()):
+        interface_name = self.__interface.lower()
+
+        if interface_name not in _BUILTIN_INTERFACES and interface_name not in self.__custom_interfaces:
             raise ValueError(
                 f"Interface name {self.__interface} is not implemented, please use: mip, pyomo, docplex or register your interface first.")
 
         if self.__interface in self.__custom_interfaces:
             self.__model = self.__custom_interfaces[self.__interface](direction = self.__direction , solver = self.__solver)
 
-        elif self.__interface.lower() == "mip":
+        elif interface_name == "mip":
             self.__model = MIPInterface(direction = self.__direction , solver = self.__solver)
 
-        elif self.__interface.lower() == "docplex":
+        elif interface_name == "docplex":
             self.__solver = "CPLEX"
             self.__model = DocplexInterface(direction = self.__direction)
 
-        elif self.__interface.lower() == "pyomo":
+        elif interface_name == "pyomo":
             self.__model = PyomoInterface(direction = self.__direction, solver=self.__solver)
 
     #@profile
@@ -201,7 +210,7 @@ class Eesrep:
             if not isinstance(ts, dict):
                 raise TypeError(f"'{ts}' time serie definition is not a dictionnary.")
 
-            if not sorted(list(ts.keys())) == ["type", "value"]:
+            if not ts.keys() == {"type", "value"}:
                 raise KeyError(f"'{ts}' time serie definition dictionnary does not have the right keys, should be ['type', 'value'].")
             
             if not isinstance(ts["type"], TimeSerieType):
@@ -210,7 +219,8 @@ class Eesrep:
             if not isinstance(ts["value"], pd.DataFrame):
                 raise TypeError(f"'{ts}' time serie 'value' is not pandas DataFrame.")
 
-            if not sorted(list(ts["value"].columns)) == ["time", "value"]:
+            columns = ts["value"].columns
+            if not (len(columns) == 2 and set(columns) == {"time", "value"}):
                 raise KeyError(f"'{ts}' time serie value definition does not have the right columns, should be ['time', 'value'].")
 
         io = component.io_from_parameters()
@@ -222,7 +232,7 @@ class Eesrep:
             if not isinstance(elem, ComponentIO):
                 raise TypeError(f"'{elem}' io definition is not a ComponentIO object.")
 
-        if "\ " in name:
+        if " " in name:
             print("/!\\ Space caracter present in the component name, please replace to underscore /!\\")
 
         if "-" in name:
@@ -232,6 +242,10 @@ class Eesrep:
             self.__buses[name] = component
         else:
             self.__components[name] = component
+            #   The components IO are static once registered, they are read from this cache afterward
+            self.__components_io[name] = io
+            self.__intensive_io.update({f"{name}_{io_name}":io[io_name].type == TimeSerieType.INTENSIVE for io_name in io})
+            self.__continuous_io[name] = [io_name for io_name in io if io[io_name].continuity]
         
         for time_serie in time_series:
             self.__time_serie_manager.add_time_serie(name+"_"+time_serie, 
@@ -330,7 +344,7 @@ class Eesrep:
         if not component_name in self.__components:
             raise ComponentNameException(component_name)
 
-        return self.__components[component_name].io_from_parameters()
+        return self.__components_io[component_name]
 
     #@profile
     def get_component_time_series(self, component_name:str) -> dict:
@@ -428,6 +442,18 @@ class Eesrep:
         else:
             raise UndefinedTimeRangeException()
 
+    def __step_offsets(self) -> np.ndarray:
+        """Returns the cumulated custom steps length from the horizon start, in time step units.
+
+        The offsets are computed from custom_steps at each call, as it can be modified directly.
+
+        Returns
+        -------
+        np.ndarray
+            Offsets of the horizon time steps, starting at 0.
+        """
+        return np.concatenate(([0.], np.cumsum(np.asarray(self.custom_steps, dtype=float))))
+
     def __make_time_steps(self) -> List[float]:
         """Returns the steps times of the current solve.
 
@@ -444,7 +470,8 @@ class Eesrep:
         if not self.__time_range_defined:
             raise UndefinedTimeRangeException()
 
-        return [self.__current_time + sum(self.custom_steps[:i])*self.time_step for i in range(len(self.custom_steps)+1)]
+        #   The steps offsets are cumulated at once instead of summing the steps prefix of each time step
+        return (self.__current_time + self.__step_offsets()*self.time_step).tolist()
 
     #@profile
     def add_link(self,
@@ -492,10 +519,10 @@ class Eesrep:
         if not component_name_2 in self.__components:
             raise ComponentNameException(component_name_2)
 
-        if not io_1.io_name in self.get_component_io(component_name_1):
+        if not io_1.io_name in self.__components_io[component_name_1]:
             raise ComponentIOException(component_name_1, io_1.io_name)
 
-        if not io_2.io_name in self.get_component_io(component_name_2):
+        if not io_2.io_name in self.__components_io[component_name_2]:
             raise ComponentIOException(component_name_2, io_2.io_name)
 
         self.__links.append({"component_name_1":component_name_1, 
@@ -542,7 +569,7 @@ class Eesrep:
         if not component_name_1 in self.__components:
             raise ComponentNameException(component_name_1)
 
-        if not io.io_name in self.__components[component_name_1].io_from_parameters():
+        if not io.io_name in self.__components_io[component_name_1]:
             raise ComponentIOException(component_name_1, io.io_name)
 
         if bus_io.io_name == "input":
@@ -570,7 +597,7 @@ class Eesrep:
         if not io.component_name in self.__components:
             raise ComponentNameException(io.component_name)
 
-        if not io.io_name in self.__components[io.component_name].io_from_parameters():
+        if not io.io_name in self.__components_io[io.component_name]:
             raise ComponentIOException(io.component_name, io.io_name)
 
         if price != 0.:
@@ -603,11 +630,13 @@ class Eesrep:
         if component_name not in self.__components:
             raise ComponentNameException(component_name)
 
-        if time_serie in self.__components[component_name].get_time_series():
-            return self.__components[component_name].get_time_series()[time_serie]["type"] == TimeSerieType.INTENSIVE
+        time_series = self.__components[component_name].get_time_series()
+        if time_serie in time_series:
+            return time_series[time_serie]["type"] == TimeSerieType.INTENSIVE
 
-        if time_serie in self.get_component_io(component_name):
-            return self.get_component_io(component_name)[time_serie].type == TimeSerieType.INTENSIVE
+        component_io = self.__components_io[component_name]
+        if time_serie in component_io:
+            return component_io[time_serie].type == TimeSerieType.INTENSIVE
 
         raise TimeSerieException(self.__components[component_name].__class__.__name__, time_serie)
 
@@ -637,11 +666,13 @@ class Eesrep:
         if component_name not in self.__components:
             raise ComponentNameException(component_name)
 
-        if time_serie in self.__components[component_name].get_time_series():
-            return self.__components[component_name].get_time_series()[time_serie]["type"] == TimeSerieType.EXTENSIVE
+        time_series = self.__components[component_name].get_time_series()
+        if time_serie in time_series:
+            return time_series[time_serie]["type"] == TimeSerieType.EXTENSIVE
 
-        if time_serie in self.get_component_io(component_name):
-            return self.get_component_io(component_name)[time_serie].type == TimeSerieType.EXTENSIVE
+        component_io = self.__components_io[component_name]
+        if time_serie in component_io:
+            return component_io[time_serie].type == TimeSerieType.EXTENSIVE
 
         raise TimeSerieException(self.__components[component_name].__class__.__name__, time_serie)
 
@@ -684,7 +715,7 @@ class Eesrep:
 
             for _ in range(0, self.horizon_count - 1):
                 print("Running time step", self.__steps_solved+1)
-                self.__current_time += sum(self.custom_steps[:self.time_shift])*self.time_step
+                self.__current_time += float(self.__step_offsets()[self.time_shift])*self.time_step
 
                 self._init_time_step()
                 self._solve_time_step()
@@ -702,6 +733,17 @@ class Eesrep:
 
         self.create_model_interface()
 
+    def __current_time_line(self) -> int:
+        """Returns the index of the first result line at or after the current time.
+
+        Returns
+        -------
+        int
+            Index of the results line where the current horizon starts.
+        """
+        #   Result times are sorted, a binary search avoids scanning the results line by line
+        return int(np.searchsorted(self.__results["time"].to_numpy(), self.__current_time, side="left"))
+
     #@profile
     def _init_time_step(self):
         """Creates the MILP model from its components definitions."""
@@ -710,55 +752,54 @@ class Eesrep:
         current_solve_time_steps = self.__make_time_steps()
 
         if self.__steps_solved > 0:
-            line_end = 0
-
-            while self.__results["time"][line_end] < self.__current_time:
-                line_end += 1
+            line_end = self.__current_time_line()
 
             old_results = self.__results[:line_end+1]
             old_future_results = self.__results.iloc[line_end:]
             
-            intensive_dict = {f"{c}_{io}":self.__components[c].io_from_parameters()[io].type == TimeSerieType.INTENSIVE for c in self.__components for io in self.__components[c].io_from_parameters()}
-            
             future_manager = TimeSerieManager(time_serie_data=old_future_results, 
-                                                intensives=intensive_dict, 
+                                                intensives=self.__intensive_io, 
                                                 is_future=True)
 
+        #   Objective terms are gathered and summed once, chained sums would nest the expressions
+        objective_terms = []
+
         #   Initialising each component
         for component in self.__components.values():
             component_time_series = self.__time_serie_manager.get_time_serie_extract(current_solve_time_steps, component)
 
             #   Loading the results of previous horizons
             if self.__steps_solved > 0:
-                history = {}
-
-                for time_serie in self.get_component_io(component.name):
-                    if self.get_component_io(component.name)[time_serie].continuity:
-                        if len(list(history)) == 0:
-                            history["time"] = old_results["time"]
+                history_ios = self.__continuous_io[component.name]
 
-                        history[time_serie] = old_results[component.name+"_"+time_serie]
+                #   The history columns are taken from the results at once, then renamed to the IO names
+                if len(history_ios) > 0:
+                    history = old_results[["time"] + [component.name+"_"+time_serie for time_serie in history_ios]]
+                    history = history.set_axis(["time"] + history_ios, axis=1)
+                else:
+                    history = pd.DataFrame()
 
-                future = future_manager.get_time_serie_extract(current_solve_time_steps[:-1], component)
+                future = future_manager.get_time_serie_extract(current_solve_time_steps[:-1], component, history_ios)
             else:
-                history = {}
+                history = pd.DataFrame()
                 future = pd.DataFrame()
 
-            #   Building the model for each component
+            #   Building the model for each component, sequentially as they all add to the same solver model
             variables, objective = component.build_model(component.name,
                                                             self.custom_steps,
                                                             component_time_series,
-                                                            pd.DataFrame(history),
+                                                            history,
                                                             self.__model, 
                                                             future = future)
 
             self.__variables[component.name] = variables
-            self.__objective = self.__model.sum_variables([self.__objective, objective])
+            objective_terms.append(objective)
 
         #   Mutualising the objectives of each component 
         for io_ in self.__objective_io_list:
-            objective = self.__model.sum_variables([io_[1]*var for var in self.__variables[io_[0].component_name][io_[0].io_name]])
-            self.__objective = self.__model.sum_variables([self.__objective, objective])
+            objective_terms.extend(io_[1]*var for var in self.__variables[io_[0].component_name][io_[0].io_name])
+
+        self.__objective = self.__model.sum_variables(objective_terms)
 
         #   Creating links
         for link in self.__links:
@@ -828,18 +869,17 @@ class Eesrep:
         link_properties : dict
             Dictionnary of the link properties, provided in the *add_link* function.
         """
-        for i in range(self.future_size):
-            coeff_1 = 1.
-            coeff_2 = 1.
-
-            if self.__is_it_intensive(link_properties["component_name_1"], link_properties["io_1"]):
-                coeff_1 = self.custom_steps[i]
+        #   The link properties are resolved once, then the constraints of all time steps are given at once
+        coeffs_1 = self.custom_steps if self.__is_it_intensive(link_properties["component_name_1"], link_properties["io_1"]) else [1.]*self.future_size
+        coeffs_2 = self.custom_steps if self.__is_it_intensive(link_properties["component_name_2"], link_properties["io_2"]) else [1.]*self.future_size
 
-            if self.__is_it_intensive(link_properties["component_name_2"], link_properties["io_2"]):
-                coeff_2 = self.custom_steps[i]
+        variables_1 = self.__variables[link_properties["component_name_1"]][link_properties["io_1"]]
+        variables_2 = self.__variables[link_properties["component_name_2"]][link_properties["io_2"]]
+        factor = link_properties["factor"]
+        offset = link_properties["offset"]
 
-            self.__model.add_equality((self.__variables[link_properties["component_name_1"]][link_properties["io_1"]][i]*link_properties["factor"] + link_properties["offset"])*coeff_1, \
-                self.__variables[link_properties["component_name_2"]][link_properties["io_2"]][i]*coeff_2)
+        self.__model.add_equality_list([(variables_1[i]*factor + offset)*coeffs_1[i] for i in range(self.future_size)],
+                                        [variables_2[i]*coeffs_2[i] for i in range(self.future_size)])
 
     #@profile
     def _create_bus(self, bus:GenericBus):
@@ -871,9 +911,7 @@ class Eesrep:
         if len(list(self.__results.columns)) == 0:
             self.__results = new_df
         else:
-            line_end = 0
-            while self.__results["time"][line_end] < self.__current_time:
-                line_end += 1
+            line_end = self.__current_time_line()
 
             self.__results = pd.concat([self.__results[:line_end+1], new_df], ignore_index=True)
 
@@ -126,6 +126,18 @@ class DocplexInterface(GenericInterface):
         """
         return self.__model.sum(array)
 
+    def sum_scaled_variables(self, array:list, coefs:list):
+        """Returns the sum of MILP variables multiplied by their coefficients as accepted by the module.
+
+        Parameters
+        ----------
+        array : list
+            List of variables that have to be summed
+        coefs : list
+            Coefficient of each variable
+        """
+        return self.__model.scal_prod(array, coefs)
+
     def get_model(self):
         """Returns the MILP module python model object.
         """
@@ -167,6 +179,42 @@ class DocplexInterface(GenericInterface):
         """
         self.__model += left_term >= right_term
 
+    def add_equality_list(self, left_terms:list, right_terms:list):
+        """Adds a list of equality constraints to the model (left_terms[i] = right_terms[i]).
+
+        Parameters
+        ----------
+        left_terms : list
+            Left hand sides of the equalities
+        right_terms : list
+            Right hand sides of the equalities
+        """
+        self.__model.add_constraints([left_term == right_term for left_term, right_term in zip(left_terms, right_terms)])
+
+    def add_lower_than_list(self, left_terms:list, right_terms:list):
+        """Adds a list of inequality constraints to the model (left_terms[i] < right_terms[i]).
+
+        Parameters
+        ----------
+        left_terms : list
+            Left hand sides of the inequalities
+        right_terms : list
+            Right hand sides of the inequalities
+        """
+        self.__model.add_constraints([left_term <= right_term for left_term, right_term in zip(left_terms, right_terms)])
+
+    def add_greater_than_list(self, left_terms:list, right_terms:list):
+        """Adds a list of inequality constraints to the model (left_terms[i] > right_terms[i]).
+
+        Parameters
+        ----------
+        left_terms : list
+            Left hand sides of the inequalities
+        right_terms : list
+            Right hand sides of the inequalities
+        """
+        self.__model.add_constraints([left_term >= right_term for left_term, right_term in zip(left_terms, right_terms)])
+
     def set_objective(self, objective):
         """Sets the objective of the model.
 
@@ -138,6 +138,21 @@ class GenericInterface(ABC):
         """
         raise NotImplementedError
 
+    def sum_scaled_variables(self, array:list, coefs:list):
+        """Returns the sum of MILP variables multiplied by their coefficients as accepted by the module.
+
+        Builds the products and sums them with sum_variables by default, interfaces whose module has a
+        weighted sum should override it.
+
+        Parameters
+        ----------
+        array : list
+            List of variables that have to be summed
+        coefs : list
+            Coefficient of each variable
+        """
+        return self.sum_variables([variable*coef for variable, coef in zip(array, coefs)])
+
     @abstractmethod
     def get_model(self):
         """Returns the MILP module python model object.
@@ -203,6 +218,51 @@ class GenericInterface(ABC):
         """
         raise NotImplementedError
 
+    def add_equality_list(self, left_terms:list, right_terms:list):
+        """Adds a list of equality constraints to the model (left_terms[i] = right_terms[i]).
+
+        Loops over add_equality by default, interfaces whose module can add constraints in bulk should override it.
+
+        Parameters
+        ----------
+        left_terms : list
+            Left hand sides of the equalities
+        right_terms : list
+            Right hand sides of the equalities
+        """
+        for left_term, right_term in zip(left_terms, right_terms):
+            self.add_equality(left_term, right_term)
+
+    def add_lower_than_list(self, left_terms:list, right_terms:list):
+        """Adds a list of inequality constraints to the model (left_terms[i] < right_terms[i]).
+
+        Loops over add_lower_than by default, interfaces whose module can add constraints in bulk should override it.
+
+        Parameters
+        ----------
+        left_terms : list
+            Left hand sides of the inequalities
+        right_terms : list
+            Right hand sides of the inequalities
+        """
+        for left_term, right_term in zip(left_terms, right_terms):
+            self.add_lower_than(left_term, right_term)
+
+    def add_greater_than_list(self, left_terms:list, right_terms:list):
+        """Adds a list of inequality constraints to the model (left_terms[i] > right_terms[i]).
+
+        Loops over add_greater_than by default, interfaces whose module can add constraints in bulk should override it.
+
+        Parameters
+        ----------
+        left_terms : list
+            Left hand sides of the inequalities
+        right_terms : list
+            Right hand sides of the inequalities
+        """
+        for left_term, right_term in zip(left_terms, right_terms):
+            self.add_greater_than(left_term, right_term)
+
     @abstractmethod
     def set_objective(self, objective):
         """Sets the objective of the model.
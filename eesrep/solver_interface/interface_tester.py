@@ -17,9 +17,11 @@ class InterfaceTester:
 
         self.test_equality()
         self.test_sum()
+        self.test_scaled_sum()
         self.test_objective()
         self.test_greater_than()
         self.test_lower_than()
+        self.test_constraint_lists()
 
         self.test_unsolvable()
         self.test_discrete_vs_continuous()
@@ -114,6 +116,17 @@ class InterfaceTester:
 
         assert sum(interface.get_results_from_variables({"component":{"test":[var, var2]}}).values) == [0.5], "Sum not working"
 
+    def test_scaled_sum(self):
+        interface:GenericInterface = self.interface_class()
+
+        var = interface.get_new_continuous_variable("test", 0, 1)
+
+        interface.add_equality(interface.sum_scaled_variables([var, 1.], [2., 0.5]), 1.5)
+
+        interface.solve()
+
+        assert interface.get_results_from_variables({"component":{"test":[var]}}).values == [0.5], "Scaled sum not working"
+
     def test_objective(self):
         interface:GenericInterface = self.interface_class()
 
@@ -153,6 +166,20 @@ class InterfaceTester:
 
         assert float(interface.get_results_from_variables({"component":{"test":[var]}}).values) == 0.5, "Lower than constraint not working"
         
+    def test_constraint_lists(self):
+        interface:GenericInterface = self.interface_class()
+
+        var = interface.get_new_continuous_variable_list("test", 3, 0, 1)
+
+        interface.add_equality_list([var[0]], [0.5])
+        interface.add_lower_than_list([var[1]], [0.25])
+        interface.add_greater_than_list([var[2]], [0.75])
+        interface.set_objective(interface.sum_variables([-var[1], var[2]]))
+
+        interface.solve()
+
+        assert list(interface.get_results_from_variables({"component":{"test":var}}).values.flatten()) == [0.5, 0.25, 0.75], "Constraint lists not working"
+        
     def test_unsolvable(self):
         interface:GenericInterface = self.interface_class()
 
@@ -4,6 +4,7 @@ import mip
 import pandas as pd
 import numpy as np
 
+from eesrep.solver_interface.generic_interface import GenericInterface
 from eesrep.eesrep_exceptions import *
 
 def cast_variable(x):
@@ -16,7 +17,7 @@ def cast_variable(x):
     else:
         raise TypeError(f"Found {type(x)} while extracting the result.")
     
-class MIPInterface():
+class MIPInterface(GenericInterface):
     """Interface class between the python MIP module and Esreep."""
 
     def __init__(self, direction="minimize", solver="CBC"):
@@ -108,7 +109,14 @@ class MIPInterface():
         max_value : float
             Variables maximal value
         """
-        return [self.get_new_continuous_variable(base_name+str(i), min_value, max_value) for i in range(count)]
+        #   The bounds are resolved once for the whole list
+        bounds = {}
+        if min_value is not None:
+            bounds["lb"] = min_value
+        if max_value is not None:
+            bounds["ub"] = max_value
+
+        return [self.__model.add_var(var_type=mip.CONTINUOUS, name=f"{base_name}{i}", **bounds) for i in range(count)]
 
     def get_new_discrete_variable_list(self,
         base_name:str,
@@ -128,7 +136,14 @@ class MIPInterface():
         max_value : float
             Variables maximal value
         """
-        return [self.get_new_discrete_variable(base_name+str(i), min_value, max_value) for i in range(count)]
+        #   The bounds are resolved once for the whole list
+        bounds = {}
+        if min_value is not None:
+            bounds["lb"] = min_value
+        if max_value is not None:
+            bounds["ub"] = max_value
+
+        return [self.__model.add_var(var_type=mip.INTEGER, name=f"{base_name}{i}", **bounds) for i in range(count)]
 
     def sum_variables(self, array):
         """Returns the sum of MILP variables as accepted by the module.
@@ -100,13 +100,7 @@ class PyomoInterface(GenericInterface):
         max_value : float
             Variables maximal value
         """
-        var_arr = [self.get_new_continuous_variable(base_name+str(i), min_value, max_value) for i in range(count)]
-
-        for i in range(count):
-            name = base_name+str(i)
-            self.__model.__dict__[name] = var_arr[i]
-
-        return var_arr
+        return [self.get_new_continuous_variable(f"{base_name}{i}", min_value, max_value) for i in range(count)]
 
     def get_new_discrete_variable_list(self,
         base_name:str,
@@ -126,13 +120,7 @@ class PyomoInterface(GenericInterface):
         max_value : float
             Variables maximal value
         """
-        var_arr = [self.get_new_discrete_variable(base_name+str(i), min_value, max_value) for i in range(count)]
-
-        for i in range(count):
-            name = base_name+str(i)
-            self.__model.__dict__[name] = var_arr[i]
-
-        return var_arr
+        return [self.get_new_discrete_variable(f"{base_name}{i}", min_value, max_value) for i in range(count)]
 
     def sum_variables(self, array):
         """Returns the sum of MILP variables as accepted by the module.
@@ -158,7 +158,7 @@ class TimeSerieManager:
         
         self.__time_series = pd.concat([self.__time_series, time_serie], axis=1)
 
-    def get_time_serie_extract(self, current_solve_time_steps:List[float], component:GenericComponent) -> pd.DataFrame:
+    def get_time_serie_extract(self, current_solve_time_steps:List[float], component:GenericComponent, keys:List[str] = None) -> pd.DataFrame:
         """Gets the time series at the current solve time steps of a given component.
 
         Parameters
@@ -167,6 +167,8 @@ class TimeSerieManager:
             List of time steps at which we want the time series.
         component : GenericComponent
             Component of which we want the time series.
+        keys : List[str], optional
+            Names of the requested time series, by default the component continuous IO if is_future, else its time series
 
         Returns
         -------
@@ -184,7 +186,13 @@ class TimeSerieManager:
 
         component_name = component.name
 
-        list_keys = [key for key in component.io_from_parameters() if component.io_from_parameters()[key].continuity] if self.is_future else component.time_series 
+        if keys is not None:
+            list_keys = keys
+        elif self.is_future:
+            component_io = component.io_from_parameters()
+            list_keys = [key for key in component_io if component_io[key].continuity]
+        else:
+            list_keys = component.time_series
 
         for key in list_keys:
             column_name = component_name+"_"+key
@@ -38,6 +38,7 @@ setup(
         'docs-requirements-txt': [
             'sphinx', 
             'sphinx_rtd_theme',
+            'sphinx-autoapi',
             'myst_parser',
             'numpydoc',
             'nbsphinx',
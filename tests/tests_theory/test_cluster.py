@@ -281,5 +281,53 @@ def test_C_005_min_off_time():
 
 
 
+@pytest.mark.Theory
+@pytest.mark.Cluster
+@pytest.mark.C_006
+def test_C_006_null_durations():
+    """
+        Tests that null minimal on/off durations do not constrain the cluster
+    """
+    app_home = path.dirname(path.realpath(__file__))
+
+    data_ts = pd.read_csv(path.join(app_home, "DataSeries", "C_001_dataseries.csv"), sep=";")
+
+    model = Eesrep(solver=solver_for_tests, interface=interface_for_tests)
+
+    bus = GenericBus("bus")
+    model.add_component(bus)
+
+    source = Source("source", 0., 10000., 1.)
+    sink = Sink("sink", 0., 10000., 10.)
+    cluster = Cluster("cluster", 1., 1., 100, 10, 0, 0, 10.)
+    fatal_sink = FatalSink("fatal_sink", (data_ts[["Time", "Load"]]).rename(columns={"Time":"time", "Load":"value"}))
+
+    model.add_component(source)
+    model.add_component(sink)
+    model.add_component(cluster)
+    model.add_component(fatal_sink)
+
+    model.add_link(source.power_out, cluster.power_in, 1., 0.)
+    model.add_link(cluster.n_machine, sink.power_in, 1., 0.)
+
+    model.plug_to_bus(cluster.power_out, bus.input, 1., 0.)
+
+    model.plug_to_bus(fatal_sink.power_in, bus.output, 1., 0.)
+
+    model.define_time_range(3600., 100, 100, 10)
+
+    model.solve()
+
+    results = model.get_results(as_dataframe=True)
+
+    assert max(np.abs(results["cluster_turn_on_count"])) == 0, "Turn on count should be null."
+    assert max(np.abs(results["cluster_turn_off_count"])) == 0, "Turn off count should be null."
+
+    criterion_array = np.array(results["cluster_n_machine"]) - np.ceil(np.array(data_ts["Load"].iloc[1:1001]/100.))
+    assert max(criterion_array) == 0, criterion_array
+
+
+
+
 if __name__ == "__main__":
     test_C_002_p_min()
\ No newline at end of file
@@ -177,5 +177,61 @@ def test_H_005_variable_maximum_storage():
     #   Relaxed condition as significative figures is too low.
     assert max(np.array(results["dam_storage"]) - np.array((500000.*data_ts["Stockage_Max"]).iloc[1:-1])) <= 1e-5
 
+@pytest.mark.Theory
+@pytest.mark.Dam
+@pytest.mark.H_006
+def test_H_006_variable_minimum_storage_price():
+    app_home = path.dirname(path.realpath(__file__))
+
+    data_ts = pd.read_csv(path.join(app_home, "DataSeries", "H_004_dataseries.csv"), sep=";")
+
+    model = Eesrep(solver=solver_for_tests, interface=interface_for_tests)
+
+    bus = GenericBus("bus")
+    model.add_component(bus)
+
+    unsupplied = Source("unsupplied", 0., 10000., 10.)
+    spilled = Sink("spilled", 0., 10000., 5000.)
+    fatal_sink = FatalSink("fatal_sink", (data_ts[["Time", "Load"]]).rename(columns={"Time":"time", "Load":"value"}))
+
+    #   Only the minimum storage is priced, going under it costs more than the unsupplied power
+    dam = Dam("dam", 
+                1., 
+                0.,
+                1000000,
+                500000,
+                0.,
+                0.,
+                1.,
+                False,
+                False,
+                1000.,
+                0.,
+                water_inflow = 
+                    (data_ts[["Time", "Amont"]]).rename(columns={"Time":"time", "Amont":"value"}),
+                variable_storage_min = 
+                    (data_ts[["Time", "Stockage_Min"]]).rename(columns={"Time":"time", "Stockage_Min":"value"}))
+
+    model.add_component(unsupplied)
+    model.add_component(spilled)
+    model.add_component(dam)
+    model.add_component(fatal_sink)
+
+    model.plug_to_bus(dam.power_out, bus.input, 1., 0.)
+
+    model.plug_to_bus(unsupplied.power_out, bus.input, 1., 0.)
+
+    model.plug_to_bus(fatal_sink.power_in, bus.output, 1., 0.)
+    model.plug_to_bus(spilled.power_in, bus.output, 1., 0.)
+
+    model.define_time_range(3600., 1, 1000, 1)
+
+    model.solve()
+
+    results = model.get_results(as_dataframe=True)
+    
+    #   Relaxed condition as significative figures is too low.
+    assert min(np.array(results["dam_storage"]) - np.array((500000.*data_ts["Stockage_Min"]).iloc[1:-1])) >= -1e-5
+
 if __name__ == "__main__":
     test_H_004_variable_minimum_storage()
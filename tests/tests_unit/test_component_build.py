@@ -59,3 +59,17 @@ def test_wrong_component_io_continuity_type():
         assert False, "ComponentIO continuity should be a string"
     except TypeError:
         assert True
+
+@pytest.mark.Unit
+@pytest.mark.component_io
+def test_component_io_equality():
+    """
+        Tests if ComponentIO objects with the same definition are equal and share their hash
+    """
+    io = ComponentIO("component", "input", TimeSerieType.INTENSIVE, False)
+
+    assert io == ComponentIO("component", "input", TimeSerieType.INTENSIVE, False), "Same ComponentIO definitions should be equal"
+    assert hash(io) == hash(ComponentIO("component", "input", TimeSerieType.INTENSIVE, False)), "Same ComponentIO definitions should share their hash"
+    assert io != ComponentIO("component", "input", TimeSerieType.INTENSIVE, True), "Different ComponentIO continuities should not be equal"
+    assert io != ComponentIO("component", "output", TimeSerieType.INTENSIVE, False), "Different ComponentIO names should not be equal"
+    assert io != ("component", "input", TimeSerieType.INTENSIVE, False), "ComponentIO should not be equal to another type"